@@ -0,0 +1,38 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.downsampling import Downsampler, point_budget
+
+SIZES = [10_000, 1_000_000, 10_000_000]
+
+
+def main() -> None:
+    budget = point_budget(9, 300)
+    rng = np.random.default_rng(0)
+
+    for size in SIZES:
+        x = np.arange(size, dtype=np.float64)
+        y = np.sin(x / 5000) * 50 + rng.normal(0, 5, size)
+
+        downsampler = Downsampler()
+        start = time.perf_counter()
+        out_x, _ = downsampler.downsample(x, y, budget, series_id=size)
+        elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        downsampler.downsample(x, y, budget, series_id=size)
+        cached = time.perf_counter() - start
+
+        print(
+            f"{size:>10} punktów -> {len(out_x)}: {elapsed * 1000:.1f} ms "
+            f"(z pamięci podręcznej: {cached * 1000:.1f} ms)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.forecasting import Forecaster
+
+SERIES = [1_000, 10_000]
+YEARS = np.arange(1994, 2024, dtype=np.float64)
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+
+    for count in SERIES:
+        values = 100 + rng.normal(0, 3, (count, len(YEARS))).cumsum(axis=1)
+        values[rng.random(values.shape) < 0.05] = np.nan
+        names = [f"stacja_{i}" for i in range(count)]
+
+        forecaster = Forecaster()
+        start = time.perf_counter()
+        forecaster.forecast(names, YEARS, values)
+        elapsed = time.perf_counter() - start
+
+        print(f"{count:>6} serii x {len(YEARS)} lat: {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
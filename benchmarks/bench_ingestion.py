@@ -0,0 +1,52 @@
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.data_loader import DataLoader
+from utils.fake_station import FakeStationServer, generate_readings
+from utils.ingestion import GaugeIngestor
+
+STATIONS = 200
+YEARS = list(range(2000, 2024))
+
+
+def main() -> None:
+    stations = {
+        f"stacja_{i}": generate_readings(
+            f"stacja_{i}", YEARS, "rivers" if i % 3 == 0 else "lakes"
+        )
+        for i in range(STATIONS)
+    }
+
+    data_dir = tempfile.mkdtemp()
+    shutil.copy("assets/data/hydro_data.json", data_dir)
+    loader = DataLoader(data_dir)
+
+    try:
+        with FakeStationServer(stations, fail_every=25) as server:
+            urls = [
+                server.url(name, "csv" if i % 2 else "json")
+                for i, name in enumerate(stations)
+            ]
+
+            start = time.perf_counter()
+            added = GaugeIngestor(urls, max_per_host=8, backoff=0.05).ingest(loader)
+            elapsed = time.perf_counter() - start
+
+            print(
+                f"{STATIONS} stacji, {added} nowych odczytów: {elapsed:.2f} s "
+                f"({STATIONS / elapsed:.0f} stacji/s)"
+            )
+
+            added = GaugeIngestor(urls, max_per_host=8, backoff=0.05).ingest(loader)
+            print(f"Ponowne pobranie, nowych odczytów: {added}")
+    finally:
+        shutil.rmtree(data_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.fake_station import generate_readings
+from utils.schema import HYDRO_VALIDATOR
+
+YEARS = list(range(1824, 2024))
+STATIONS = 5000
+
+
+def build_dataset() -> dict:
+    data = {
+        "nazwa_projektu": "Benchmark",
+        "lokalizacja": "Jeziora Mazurskie",
+        "data_pomiarow": [
+            {
+                "year": year,
+                "water_bodies": {"lakes": [], "rivers": []},
+                "average_water_level": 100.0,
+                "temperature": 15.0,
+            }
+            for year in YEARS
+        ],
+    }
+
+    for i in range(STATIONS):
+        kind = "rivers" if i % 3 == 0 else "lakes"
+        for year_data, reading in zip(
+            data["data_pomiarow"], generate_readings(f"stacja_{i}", YEARS, kind)
+        ):
+            year_data["water_bodies"][kind].append(
+                {"name": reading["station"], "water_level": reading["water_level"]}
+            )
+
+    return data
+
+
+def main() -> None:
+    data = build_dataset()
+    records = len(YEARS) * STATIONS
+
+    start = time.perf_counter()
+    errors = HYDRO_VALIDATOR.validate(data)
+    elapsed = time.perf_counter() - start
+    print(
+        f"Pełna walidacja {records} rekordów: {elapsed:.2f} s "
+        f"({elapsed / records * 1_000_000:.2f} s / mln rekordów, błędów: {len(errors)})"
+    )
+
+    data["data_pomiarow"][7]["water_bodies"]["lakes"][3]["water_level"] = -1.0
+    data["data_pomiarow"][9]["temperature"] = "15"
+
+    start = time.perf_counter()
+    errors = HYDRO_VALIDATOR.validate(data)
+    elapsed = time.perf_counter() - start
+    print(f"Walidacja z błędami: {elapsed:.2f} s, błędów: {len(errors)}")
+
+    start = time.perf_counter()
+    HYDRO_VALIDATOR.validate(data, sample=True, seed=0)
+    elapsed = time.perf_counter() - start
+    print(f"Walidacja próbkowa: {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
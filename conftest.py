@@ -0,0 +1 @@
+# Pozwala uruchamiać testy samym `pytest`: katalog główny trafia na sys.path
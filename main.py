@@ -11,7 +11,7 @@ from states.polution_level import Polution
 from states.temperature_level import Temperature
 from states.water_level import Water
 from utils.palette import *
-from utils.states import State
+from utils.states import ScreenManager, State
 
 
 class App:
@@ -31,10 +31,14 @@ class App:
         os.makedirs("assets/data", exist_ok=True)
         os.makedirs("reports", exist_ok=True)
 
-        self.main_menu = MainMenu()
-        self.water_menu = Water()
-        self.polution_menu = Polution()
-        self.temperature_menu = Temperature()
+        self.screens = ScreenManager(
+            {
+                "MAIN_MENU": MainMenu,
+                "WATER": Water,
+                "POLUTION": Polution,
+                "TEMPERATURE": Temperature,
+            }
+        )
 
     def run(self) -> None:
         while self.state.running:
@@ -52,43 +56,22 @@ class App:
             if event.type == pygame.QUIT:
                 self.state.toggle_run_state(False)
 
-            match self.state.state:
-                case "MAIN_MENU":
-                    self.main_menu.handle_events(event)
-                case "WATER":
-                    self.water_menu.handle_events(event)
-                case "POLUTION":
-                    self.polution_menu.handle_events(event)
-                case "TEMPERATURE":
-                    self.temperature_menu.handle_events(event)
+            # Przycisk mógł zmienić stan przy poprzednim zdarzeniu tej klatki
+            self.screens.update()
+            self.screens.current.handle_events(event)
 
     def update(self) -> None:
-        match self.state.state:
-            case "MAIN_MENU":
-                pass
-            case "WATER":
-                pass
-            case "POLUTION":
-                pass
-            case "TEMPERATURE":
-                pass
+        self.screens.update()
 
     def render(self) -> None:
         self.screen.fill(background_color)
 
-        match self.state.state:
-            case "MAIN_MENU":
-                self.main_menu.render(self.screen)
-            case "WATER":
-                self.water_menu.render(self.screen)
-            case "POLUTION":
-                self.polution_menu.render(self.screen)
-            case "TEMPERATURE":
-                self.temperature_menu.render(self.screen)
+        self.screens.current.render(self.screen)
 
         pygame.display.flip()
 
     def quit(self) -> None:
+        self.screens.close()
         pygame.quit()
         sys.exit()
 
@@ -1,9 +1,12 @@
 import pygame
 
+from utils.screen import Screen
 from utils.ui import UI
 
-class MainMenu:
+class MainMenu(Screen):
     def __init__(self) -> None:
+        super().__init__()
+
         self.ui = UI()
 
     def handle_events(self, ev: pygame.event.Event):
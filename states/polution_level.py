@@ -3,11 +3,14 @@ import pygame
 from utils.button import Button
 from utils.data_loader import DataLoader
 from utils.report_generation import ReportGenerator
+from utils.screen import Screen
 from utils.ui import UI
 
 
-class Polution:
+class Polution(Screen):
     def __init__(self) -> None:
+        super().__init__()
+
         self.generate_button = Button("assets/graphics/polution_report.png", (800, 750))
 
         self.data_loader = DataLoader()
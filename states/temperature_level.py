@@ -3,11 +3,19 @@ import pygame
 from utils.button import Button
 from utils.data_loader import DataLoader
 from utils.report_generation import ReportGenerator
+from utils.screen import Screen
 from utils.ui import UI
 from utils.states import State
 
-class Temperature:
+class Temperature(Screen):
+    surface_paths = {
+        "map1sl": "assets/maps/temperature/map_temp_21.png",
+        "map1sr": "assets/maps/temperature/Temp21.png",
+    }
+
     def __init__(self) -> None:
+        super().__init__()
+
         self.generate_button = Button(
             "assets/graphics/temperature_report.png", (800, 750)
         )
@@ -15,12 +23,6 @@ class Temperature:
         self.data_loader = DataLoader()
         self.report_generation = ReportGenerator()
 
-        self.map1sl = pygame.image.load("assets/maps/temperature/map_temp_21.png")
-        self.map1rl = self.map1sl.get_rect(center=(1000, 400))
-
-        self.map1sr = pygame.image.load("assets/maps/temperature/Temp21.png")
-        self.map1rr = self.map1sr.get_rect(center=(1000, 400))
-
         self.ui = UI()
         
         self.state = State()
@@ -45,9 +47,11 @@ class Temperature:
 
         match self.image:
             case 1:
-                w.blit(self.map1sl, self.map1rl)
+                map_surface = self.surfaces["map1sl"]
             case 2:
-                w.blit(self.map1sr, self.map1rr)
+                map_surface = self.surfaces["map1sr"]
+
+        w.blit(map_surface, map_surface.get_rect(center=(1000, 400)))
 
         self.generate_button.render(w)
         self.ui.render(w)
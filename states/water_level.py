@@ -3,22 +3,24 @@ import pygame
 from utils.button import Button
 from utils.data_loader import DataLoader
 from utils.report_generation import ReportGenerator
+from utils.screen import Screen
 from utils.ui import UI
 from utils.states import State
 
-class Water:
+class Water(Screen):
+    surface_paths = {
+        "map1sl": "assets/maps/level/map_level_21.png",
+        "map1sr": "assets/maps/level/Poz21.png",
+    }
+
     def __init__(self) -> None:
+        super().__init__()
+
         self.generate_button = Button("assets/graphics/water_report.png", (800, 750))
 
         self.data_loader = DataLoader()
         self.report_generation = ReportGenerator()
 
-        self.map1sl = pygame.image.load("assets/maps/level/map_level_21.png")
-        self.map1rl = self.map1sl.get_rect(center=(1000, 400))
-
-        self.map1sr = pygame.image.load("assets/maps/temperature/Poz21.png")
-        self.map1rr = self.map1sr.get_rect(center=(1000, 400))
-
         self.state = State()
         
         self.ui = UI()
@@ -41,9 +43,11 @@ class Water:
 
         match self.image:
             case 1:
-                w.blit(self.map1sl, self.map1rl)
+                map_surface = self.surfaces["map1sl"]
             case 2:
-                w.blit(self.map1sr, self.map1rr)
+                map_surface = self.surfaces["map1sr"]
+
+        w.blit(map_surface, map_surface.get_rect(center=(1000, 400)))
 
         self.generate_button.render(w)
         self.ui.render(w)
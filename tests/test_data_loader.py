@@ -0,0 +1,72 @@
+import json
+import os
+
+from utils.data_loader import DataLoader
+
+DATA_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "assets",
+    "data",
+    "hydro_data.json",
+)
+
+
+def load_data():
+    with open(DATA_FILE, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def year(data, value):
+    return next(y for y in data["data_pomiarow"] if y["year"] == value)
+
+
+def test_merge_keeps_measured_regional_temperature():
+    data = load_data()
+    reading = {
+        "station": "Nowa stacja",
+        "kind": "lakes",
+        "year": 2023,
+        "water_level": 90.0,
+        "temperature": 3.0,
+    }
+
+    assert DataLoader().merge_readings(data, [reading]) == 1
+    assert year(data, 2023)["temperature"] == 16.8
+
+
+def test_merge_derives_temperature_only_for_new_years():
+    data = load_data()
+    readings = [
+        {"station": "A", "kind": "lakes", "year": 2030, "water_level": 50.0},
+        {"station": "B", "kind": "rivers", "year": 2031, "water_level": 70.0},
+        {
+            "station": "C",
+            "kind": "rivers",
+            "year": 2031,
+            "water_level": 90.0,
+            "temperature": 14.0,
+        },
+    ]
+
+    DataLoader().merge_readings(data, readings)
+
+    assert year(data, 2030)["temperature"] is None
+    assert year(data, 2031)["temperature"] == 14.0
+    assert year(data, 2031)["average_water_level"] == 80.0
+
+
+def test_merge_recomputes_average_and_fills_missing_levels():
+    data = load_data()
+    readings = [
+        {"station": "J. Śniardwy", "kind": "lakes", "year": 2022, "water_level": 250.0},
+        {"station": "J. Wigry", "kind": "lakes", "year": 2022, "water_level": 1.0},
+    ]
+
+    assert DataLoader().merge_readings(data, readings) == 1
+
+    bodies = year(data, 2022)["water_bodies"]
+    levels = [b["water_level"] for group in bodies.values() for b in group]
+    assert 250.0 in levels and 1.0 not in levels
+    assert year(data, 2022)["average_water_level"] == round(
+        sum(levels) / len(levels), 2
+    )
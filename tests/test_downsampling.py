@@ -0,0 +1,61 @@
+import numpy as np
+
+from utils.downsampling import Downsampler, lttb, minmax_decimate
+
+
+def noisy_series(size=100_000, seed=0):
+    rng = np.random.default_rng(seed)
+    x = np.arange(size, dtype=np.float64)
+    return x, rng.normal(0, 1, size)
+
+
+def test_lttb_keeps_endpoints_and_budget():
+    x, y = noisy_series(10_000)
+    out_x, out_y = lttb(x, y, 500)
+
+    assert len(out_x) == 500
+    assert out_x[0] == x[0] and out_x[-1] == x[-1]
+    assert np.all(np.diff(out_x) > 0)
+    assert np.isin(out_y, y).all()
+
+
+def test_minmax_keeps_extrema_and_budget():
+    x, y = noisy_series(10_000)
+    y[1234] = 50.0
+    y[8765] = -50.0
+    out_x, out_y = minmax_decimate(x, y, 400)
+
+    assert len(out_x) <= 400
+    assert out_x[0] == x[0] and out_x[-1] == x[-1]
+    assert out_y.max() == 50.0 and out_y.min() == -50.0
+
+
+def test_downsample_keeps_spike_within_budget():
+    x, y = noisy_series()
+    y[54321] = 500.0
+    out_x, out_y = Downsampler().downsample(x, y, 300)
+
+    assert len(out_x) <= 300
+    assert out_y.max() == 500.0
+
+
+def test_changed_series_without_id_is_not_served_from_cache():
+    x = np.arange(100_000, dtype=np.float64)
+    y = np.zeros_like(x)
+    downsampler = Downsampler()
+    downsampler.downsample(x, y, 300)
+
+    y = y.copy()
+    y[12345] = 500.0
+    _, out_y = downsampler.downsample(x, y, 300)
+
+    assert out_y.max() == 500.0
+
+
+def test_series_id_reuses_cached_result():
+    x, y = noisy_series()
+    downsampler = Downsampler()
+    first = downsampler.downsample(x, y, 300, series_id="poziom")
+    second = downsampler.downsample(x, y, 300, series_id="poziom")
+
+    assert first is second
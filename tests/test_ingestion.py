@@ -0,0 +1,56 @@
+import asyncio
+import os
+import shutil
+
+import pytest
+
+from utils.data_loader import DataLoader
+from utils.fake_station import FakeStationServer, generate_readings
+from utils.ingestion import FetchError, GaugeIngestor
+
+YEARS = [2024, 2025]
+DATA_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "assets",
+    "data",
+    "hydro_data.json",
+)
+
+
+@pytest.fixture
+def loader(tmp_path):
+    shutil.copy(DATA_FILE, tmp_path)
+    return DataLoader(str(tmp_path))
+
+
+@pytest.fixture
+def stations():
+    return {f"stacja_{i}": generate_readings(f"stacja_{i}", YEARS) for i in range(4)}
+
+
+def test_retries_after_server_errors(loader, stations):
+    with FakeStationServer(stations, fail_every=2) as server:
+        urls = [server.url(name) for name in stations]
+        added = GaugeIngestor(urls, backoff=0.01).ingest(loader)
+
+    assert added == len(stations) * len(YEARS)
+    assert sum(server.hits.values()) > len(stations)
+
+
+def test_missing_station_is_not_retried(stations):
+    with FakeStationServer(stations) as server:
+        url = server.url("nieznana")
+        ingestor = GaugeIngestor([url], retries=3, backoff=0.01)
+
+        with pytest.raises(FetchError):
+            asyncio.run(ingestor.fetch_station(url))
+
+    assert server.hits["/stations/nieznana.json"] == 1
+
+
+def test_second_run_adds_nothing(loader, stations):
+    with FakeStationServer(stations) as server:
+        urls = [server.url(name, "csv") for name in stations]
+
+        assert GaugeIngestor(urls).ingest(loader) == len(stations) * len(YEARS)
+        assert GaugeIngestor(urls).ingest(loader) == 0
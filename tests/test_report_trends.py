@@ -0,0 +1,54 @@
+import os
+
+import numpy as np
+
+from utils.report_generation import ReportGenerator
+
+ASSETS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets"
+)
+
+
+def make_data(water, temperature):
+    return {
+        "nazwa_projektu": "Test",
+        "lokalizacja": "Test",
+        "data_pomiarow": [
+            {
+                "year": 1990 + i,
+                "water_bodies": {"lakes": [{"name": "Jezioro", "water_level": w}]},
+                "average_water_level": w,
+                "temperature": t,
+            }
+            for i, (w, t) in enumerate(zip(water, temperature))
+        ],
+    }
+
+
+def analyze(tmp_path, water, temperature):
+    generator = ReportGenerator(reports_dir=str(tmp_path), assets_dir=ASSETS_DIR)
+    data = make_data(water, temperature)
+    return generator._analyze_trends(data, generator._forecast(data))
+
+
+def test_noisy_trend_is_detected(tmp_path):
+    rng = np.random.default_rng(0)
+    years = np.arange(30)
+    water = 100 + 2.0 * years + rng.normal(0, 3.0, len(years))
+    temperature = 8 - 0.5 * years + rng.normal(0, 0.5, len(years))
+
+    trends = analyze(tmp_path, water.tolist(), temperature.tolist())
+
+    assert "trend wzrostowy" in trends["water"]
+    assert "trend spadkowy" in trends["temperature"]
+
+
+def test_flat_series_is_stable(tmp_path):
+    rng = np.random.default_rng(1)
+    water = 100 + rng.normal(0, 1.0, 30)
+    temperature = 8 + rng.normal(0, 0.1, 30)
+
+    trends = analyze(tmp_path, water.tolist(), temperature.tolist())
+
+    assert "stabiln" in trends["water"]
+    assert "stabiln" in trends["temperature"]
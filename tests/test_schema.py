@@ -0,0 +1,71 @@
+import json
+import os
+
+from utils.schema import HYDRO_SCHEMA, HYDRO_VALIDATOR, SchemaValidator
+
+DATA_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "assets",
+    "data",
+    "hydro_data.json",
+)
+
+
+def load_data():
+    with open(DATA_FILE, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def test_shipped_dataset_is_valid_with_null_water_levels():
+    data = load_data()
+
+    assert data["data_pomiarow"][1]["water_bodies"]["lakes"][7]["water_level"] is None
+    assert HYDRO_VALIDATOR.validate(data) == []
+
+
+def test_collects_every_violation_with_its_path():
+    data = load_data()
+    del data["data_pomiarow"][0]["year"]
+    data["data_pomiarow"][1]["water_bodies"]["lakes"][2]["water_level"] = -3
+    data["data_pomiarow"][2]["temperature"] = "15"
+    data["data_pomiarow"][0]["water_bodies"]["rivers"][1]["name"] = None
+    data["lokalizacja"] = 5
+
+    paths = {str(error) for error in HYDRO_VALIDATOR.validate(data)}
+
+    assert paths == {
+        "$.lokalizacja: oczekiwano typu 'string'",
+        "$.data_pomiarow[0]: brak wymaganego klucza 'year'",
+        "$.data_pomiarow[0].water_bodies.rivers[1].name: oczekiwano typu 'string'",
+        "$.data_pomiarow[1].water_bodies.lakes[2].water_level: "
+        "wartość mniejsza niż 0",
+        "$.data_pomiarow[2].temperature: oczekiwano typu 'number lub null'",
+    }
+
+
+def test_bool_is_not_a_number_or_integer():
+    data = load_data()
+    data["data_pomiarow"][0]["year"] = True
+    data["data_pomiarow"][1]["average_water_level"] = False
+
+    paths = [error.path for error in HYDRO_VALIDATOR.validate(data)]
+
+    assert paths == [
+        "$.data_pomiarow[0].year",
+        "$.data_pomiarow[1].average_water_level",
+    ]
+
+
+def test_sample_mode_is_deterministic_with_seed():
+    data = load_data()
+    for year_data in data["data_pomiarow"]:
+        for body in year_data["water_bodies"]["lakes"]:
+            body["water_level"] = -1.0
+
+    validator = SchemaValidator(HYDRO_SCHEMA, sample_size=5)
+    first = validator.validate(data, sample=True, seed=7)
+    second = validator.validate(data, sample=True, seed=7)
+
+    assert first == second
+    assert 0 < len(first) <= 5
+    assert all(error.path.endswith(".water_level") for error in first)
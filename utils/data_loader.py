@@ -1,6 +1,10 @@
 import json
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+from utils.schema import HYDRO_VALIDATOR
+
+MAX_REPORTED_ERRORS = 20
 
 
 class DataLoader:
@@ -25,30 +29,107 @@ class DataLoader:
             print(f"Nieoczekiwany błąd podczas ładowania danych: {e}")
             return None
 
-    def validate_data(self, data: Dict[str, Any]) -> bool:
-        required_keys = ["nazwa_projektu", "lokalizacja", "data_pomiarow"]
+    def save_json_data(self, filename: str, data: Dict[str, Any]) -> bool:
+        filepath = os.path.join(self.data_dir, filename)
+        tmp_path = filepath + ".tmp"
 
-        if not all(key in data for key in required_keys):
-            print("Błąd: Brakuje wymaganych kluczy w danych")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump(data, file, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, filepath)
+            return True
+        except OSError as e:
+            print(f"Błąd zapisu danych do {filepath}: {e}")
             return False
 
-        if not isinstance(data["data_pomiarow"], list):
-            print("Błąd: 'data_pomiarow' musi być listą")
-            return False
+    def merge_readings(
+        self, data: Dict[str, Any], readings: List[Dict[str, Any]]
+    ) -> int:
+        """Dopisuje do danych tylko odczyty, których jeszcze nie ma"""
+        years = {year_data["year"]: year_data for year_data in data["data_pomiarow"]}
+        # Wpisy z pustym poziomem wody to luki do uzupełnienia, a nie odczyty
+        known = {
+            (year, body["name"]): body
+            for year, year_data in years.items()
+            for bodies in year_data["water_bodies"].values()
+            for body in bodies
+        }
+
+        added = 0
+        touched = set()
+
+        for reading in readings:
+            year = reading["year"]
+            key = (year, reading["station"])
+            body = known.get(key)
+            if body is not None and body["water_level"] is not None:
+                continue
+
+            if year not in years:
+                years[year] = {
+                    "year": year,
+                    "water_bodies": {"lakes": [], "rivers": []},
+                    "average_water_level": 0.0,
+                    "temperature": None,
+                }
+                data["data_pomiarow"].append(years[year])
+
+            if body is None:
+                body = {"name": reading["station"]}
+                years[year]["water_bodies"].setdefault(reading["kind"], []).append(body)
+                known[key] = body
+
+            body["water_level"] = reading["water_level"]
+            if "temperature" in reading:
+                body["temperature"] = reading["temperature"]
+
+            touched.add(year)
+            added += 1
+
+        for year in touched:
+            self._update_aggregates(years[year])
+
+        data["data_pomiarow"].sort(key=lambda year_data: year_data["year"])
+        return added
+
+    @staticmethod
+    def _update_aggregates(year_data: Dict[str, Any]) -> None:
+        bodies = [
+            body for bodies in year_data["water_bodies"].values() for body in bodies
+        ]
+
+        levels = [
+            body["water_level"] for body in bodies if body["water_level"] is not None
+        ]
+        if levels:
+            year_data["average_water_level"] = round(sum(levels) / len(levels), 2)
+
+        # Zmierzona temperatura regionu ma pierwszeństwo przed odczytami stacji;
+        # średnią ze stacji wpisujemy tylko dla roku, który jej jeszcze nie ma.
+        if year_data["temperature"] is not None:
+            return
+
+        temperatures = [body["temperature"] for body in bodies if "temperature" in body]
+        if temperatures:
+            year_data["temperature"] = round(sum(temperatures) / len(temperatures), 1)
+
+    def append_readings(self, filename: str, readings: List[Dict[str, Any]]) -> int:
+        data = self.load_json_data(filename)
+        if data is None or not self.validate_data(data):
+            return 0
+
+        added = self.merge_readings(data, readings)
+        if added and not self.save_json_data(filename, data):
+            return 0
+
+        return added
+
+    def validate_data(self, data: Dict[str, Any], sample: bool = False) -> bool:
+        errors = HYDRO_VALIDATOR.validate(data, sample=sample)
+
+        for error in errors[:MAX_REPORTED_ERRORS]:
+            print(f"Błąd walidacji: {error}")
+        if len(errors) > MAX_REPORTED_ERRORS:
+            print(f"... oraz {len(errors) - MAX_REPORTED_ERRORS} kolejnych błędów")
 
-        for year_data in data["data_pomiarow"]:
-            if not all(
-                key in year_data
-                for key in [
-                    "year",
-                    "water_bodies",
-                    "average_water_level",
-                    "temperature",
-                ]
-            ):
-                print(
-                    f"Błąd: Niepoprawna struktura danych dla roku {year_data.get('year', 'nieznany')}"
-                )
-                return False
-
-        return True
+        return not errors
@@ -0,0 +1,121 @@
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+import numpy as np
+
+
+def point_budget(width_inches: float, dpi: float, points_per_pixel: float = 1.0) -> int:
+    """Liczba punktów, jaką warto narysować na wykresie o danej szerokości"""
+    return max(3, int(width_inches * dpi * points_per_pixel))
+
+
+def minmax_decimate(
+    x: np.ndarray, y: np.ndarray, n_out: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Zostawia minimum i maksimum z każdego przedziału, zachowując szczyty"""
+    n = len(x)
+    buckets = max(1, (n_out - 2) // 2)
+    if n <= n_out or n <= 2 * buckets + 2:
+        return x, y
+
+    edges = np.linspace(1, n - 1, buckets + 1).astype(np.intp)
+    inner = y[1 : n - 1]
+    sizes = np.diff(edges)
+
+    # Przedziały układamy w macierz 2D o szerokości najdłuższego z nich,
+    # a nadmiarowe komórki maskujemy, żeby argmin/argmax liczyć naraz.
+    width = int(sizes.max())
+    starts = edges[:-1] - 1
+    offsets = np.arange(width)
+    valid = offsets < sizes[:, None]
+    windows = inner[np.minimum(starts[:, None] + offsets, len(inner) - 1)]
+
+    idx_min = starts + np.where(valid, windows, np.inf).argmin(axis=1) + 1
+    idx_max = starts + np.where(valid, windows, -np.inf).argmax(axis=1) + 1
+
+    keep = np.concatenate(([0], idx_min, idx_max, [n - 1]))
+    keep = np.unique(keep)
+    return x[keep], y[keep]
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Largest-Triangle-Three-Buckets: wybiera punkty najlepiej oddające kształt"""
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return x, y
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+
+    # Średnie wszystkich przedziałów liczone jednorazowo przez sumy skumulowane.
+    cx = np.concatenate(([0.0], np.cumsum(x, dtype=np.float64)))
+    cy = np.concatenate(([0.0], np.cumsum(y, dtype=np.float64)))
+    next_start = edges[1:]
+    next_end = np.append(edges[2:], n)
+    counts = next_end - next_start
+    mean_x = (cx[next_end] - cx[next_start]) / counts
+    mean_y = (cy[next_end] - cy[next_start]) / counts
+
+    keep = np.empty(n_out, dtype=np.intp)
+    keep[0] = 0
+    keep[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        bx, by = x[lo:hi], y[lo:hi]
+        area = np.abs(
+            (x[a] - mean_x[i]) * (by - y[a]) - (x[a] - bx) * (mean_y[i] - y[a])
+        )
+        a = lo + int(area.argmax())
+        keep[i + 1] = a
+
+    return x[keep], y[keep]
+
+
+class Downsampler:
+    """Redukuje długie serie przed rysowaniem i zapamiętuje wyniki"""
+
+    def __init__(self, max_entries: int = 64, prefilter_factor: int = 4) -> None:
+        self.max_entries = max_entries
+        self.prefilter_factor = prefilter_factor
+        self._cache: (
+            "OrderedDict[Tuple[Hashable, int], Tuple[np.ndarray, np.ndarray]]"
+        ) = OrderedDict()
+
+    def downsample(
+        self, x, y, budget: int, series_id: Optional[Hashable] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Zwraca co najwyżej `budget` punktów serii
+
+        Wynik trafia do pamięci podręcznej tylko wtedy, gdy wywołujący poda
+        `series_id` jednoznacznie opisujący dane (np. skrót zbioru danych
+        i nazwę serii) - bez niego każda seria jest liczona od nowa.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+
+        if len(x) <= budget:
+            return x, y
+
+        key = None if series_id is None else (series_id, budget)
+        if key is not None and key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        # Bardzo długie serie najpierw przerzedzamy min-max (w pełni wektorowo),
+        # a dopiero potem LTTB wybiera ostateczne punkty.
+        prefilter_budget = budget * self.prefilter_factor
+        if len(x) > prefilter_budget:
+            x, y = minmax_decimate(x, y, prefilter_budget)
+
+        result = lttb(x, y, budget)
+
+        if key is not None:
+            self._cache[key] = result
+            if len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+        return result
+
+    def clear(self) -> None:
+        self._cache.clear()
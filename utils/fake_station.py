@@ -0,0 +1,116 @@
+import csv
+import io
+import json
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+
+def generate_readings(
+    station: str, years: List[int], kind: str = "lakes", seed: int = 0
+) -> List[Dict[str, Any]]:
+    rng = random.Random(f"{station}-{seed}")
+    base_level = rng.uniform(50, 250)
+    base_temperature = rng.uniform(13, 17)
+
+    return [
+        {
+            "station": station,
+            "kind": kind,
+            "year": year,
+            "water_level": round(base_level + rng.uniform(-10, 10), 1),
+            "temperature": round(base_temperature + rng.uniform(-1, 1), 1),
+        }
+        for year in years
+    ]
+
+
+class _StationHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "FakeStationServer"
+
+    def do_GET(self) -> None:
+        self.server.record(self.path)
+        name, _, extension = self.path.strip("/").rpartition("/")[2].partition(".")
+        readings = self.server.stations.get(name)
+
+        if readings is None:
+            self._send(404, "text/plain", b"unknown station")
+            return
+
+        if self.server.should_fail():
+            self._send(503, "text/plain", b"station busy")
+            return
+
+        if extension == "csv":
+            buffer = io.StringIO()
+            writer = csv.DictWriter(buffer, fieldnames=list(readings[0].keys()))
+            writer.writeheader()
+            writer.writerows(readings)
+            self._send(200, "text/csv", buffer.getvalue().encode("utf-8"))
+        else:
+            body = json.dumps({"readings": readings}, ensure_ascii=False)
+            self._send(200, "application/json", body.encode("utf-8"))
+
+    def _send(self, status: int, content_type: str, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class FakeStationServer(ThreadingHTTPServer):
+    """Lokalny serwer udający stacje pomiarowe, do testów i pomiarów wydajności"""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        stations: Dict[str, List[Dict[str, Any]]],
+        port: int = 0,
+        fail_every: int = 0,
+    ) -> None:
+        super().__init__(("127.0.0.1", port), _StationHandler)
+        self.stations = stations
+        self.fail_every = fail_every
+
+        self.hits: Dict[str, int] = {}
+        self._requests = 0
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def record(self, path: str) -> None:
+        with self._lock:
+            self.hits[path] = self.hits.get(path, 0) + 1
+
+    def should_fail(self) -> bool:
+        with self._lock:
+            self._requests += 1
+            return self.fail_every > 0 and self._requests % self.fail_every == 0
+
+    def url(self, station: str, extension: str = "json") -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/stations/{station}.{extension}"
+
+    def start(self) -> "FakeStationServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeStationServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
@@ -0,0 +1,306 @@
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+# Dwustronne kwantyle rozkładu t-Studenta dla 95% (df = 1..30), dalej ~1.96
+_T95 = np.array(
+    [
+        np.nan,
+        12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+        2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+        2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+    ]
+)  # fmt: skip
+
+# Tyle lat historii musi dać porównywalne błędy, zanim zrezygnujemy z regresji
+MIN_COMPARED_ERRORS = 2
+
+
+def t_quantile_95(df: np.ndarray) -> np.ndarray:
+    df = np.asarray(df)
+    values = _T95[np.clip(df, 0, len(_T95) - 1).astype(np.intp)]
+    return np.where(df >= len(_T95), 1.96, values)
+
+
+def series_from_data(data: Dict[str, Any]) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """Układa wszystkie serie pomiarowe w macierz (serie x lata), braki jako NaN"""
+    measurements = sorted(
+        data["data_pomiarow"], key=lambda year_data: year_data["year"]
+    )
+    years = np.array(
+        [year_data["year"] for year_data in measurements], dtype=np.float64
+    )
+
+    names = ["average_water_level", "temperature"]
+    rows: Dict[str, int] = {}
+    for year_data in measurements:
+        for bodies in year_data["water_bodies"].values():
+            for body in bodies:
+                rows.setdefault(body["name"], len(names) + len(rows))
+    names += list(rows)
+
+    values = np.full((len(names), len(years)), np.nan)
+    for column, year_data in enumerate(measurements):
+        values[0, column] = year_data["average_water_level"]
+        values[1, column] = year_data["temperature"]
+        for bodies in year_data["water_bodies"].values():
+            for body in bodies:
+                if body["water_level"] is not None:
+                    values[rows[body["name"]], column] = body["water_level"]
+
+    return names, years, values
+
+
+class _Design:
+    """Macierz planu wspólna dla wszystkich serii o tej samej osi lat"""
+
+    def __init__(self, years: np.ndarray, horizon: int) -> None:
+        self.years = years
+        self.center = years.mean()
+        self.t = years - self.center
+        self.t2 = self.t**2
+
+        step = np.median(np.diff(years)) if len(years) > 1 else 1.0
+        self.step = step
+        self.future_years = years[-1] + step * np.arange(1, horizon + 1)
+        self.future_t = self.future_years - self.center
+
+
+class ForecastResult:
+    def __init__(
+        self,
+        names: List[str],
+        years: np.ndarray,
+        future_years: np.ndarray,
+        models: Dict[str, Dict[str, np.ndarray]],
+        chosen: np.ndarray,
+    ) -> None:
+        self.names = names
+        self.years = years
+        self.future_years = future_years
+        self.models = models
+        self.chosen = chosen
+        self._rows = {name: row for row, name in enumerate(names)}
+
+    def series(self, name: str, model: str = "best") -> Dict[str, np.ndarray]:
+        """Wyniki jednej serii; "best" to model wybrany dla niej przy dopasowaniu"""
+        row = self._rows[name]
+        return {key: values[row] for key, values in self.models[model].items()}
+
+
+class Forecaster:
+    """Dopasowuje modele prognostyczne do wszystkich serii naraz
+
+    Modele: regresja liniowa i wygładzanie wykładnicze Holta, oba z 95%
+    przedziałem predykcji. Dla każdej serii wybierany jest model o mniejszym
+    błędzie prognozy na kolejny rok. Wyniki są zapamiętywane według skrótu
+    zbioru danych.
+    """
+
+    def __init__(
+        self,
+        horizon: int = 3,
+        alpha: float = 0.5,
+        beta: float = 0.3,
+        max_entries: int = 16,
+    ) -> None:
+        self.horizon = horizon
+        self.alpha = alpha
+        self.beta = beta
+        self.max_entries = max_entries
+
+        self._designs: Dict[Tuple[float, ...], _Design] = {}
+        self._cache: "OrderedDict[str, ForecastResult]" = OrderedDict()
+
+    @staticmethod
+    def dataset_hash(data: Dict[str, Any]) -> str:
+        payload = json.dumps(data, sort_keys=True, ensure_ascii=False)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _design(self, years: np.ndarray) -> _Design:
+        key = tuple(years.tolist())
+        if key not in self._designs:
+            self._designs[key] = _Design(years, self.horizon)
+        return self._designs[key]
+
+    def forecast_data(self, data: Dict[str, Any]) -> ForecastResult:
+        key = self.dataset_hash(data)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        names, years, values = series_from_data(data)
+        result = self.forecast(names, years, values)
+
+        self._cache[key] = result
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+        return result
+
+    def forecast(
+        self, names: List[str], years: np.ndarray, values: np.ndarray
+    ) -> ForecastResult:
+        design = self._design(np.asarray(years, dtype=np.float64))
+        values = np.atleast_2d(np.asarray(values, dtype=np.float64))
+
+        linear = self._fit_linear(design, values)
+        holt = self._fit_holt(design, values)
+
+        # Model wybieramy osobno dla każdej serii - ten, który lepiej
+        # przewidywał kolejny rok na tych samych latach historii.
+        common = ~np.isnan(linear["errors"]) & ~np.isnan(holt["errors"])
+        count = common.sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            linear_mse = np.where(common, linear["errors"] ** 2, 0.0).sum(1) / count
+            holt_mse = np.where(common, holt["errors"] ** 2, 0.0).sum(1) / count
+        use_holt = (count >= MIN_COMPARED_ERRORS) & (holt_mse < linear_mse)
+
+        best = {
+            key: np.where(
+                use_holt.reshape((-1,) + (1,) * (linear[key].ndim - 1)),
+                holt[key],
+                linear[key],
+            )
+            for key in ("forecast", "lower", "upper", "level", "slope", "slope_margin")
+        }
+        models = {"linear": linear, "holt": holt, "best": best}
+        chosen = np.where(use_holt, "holt", "linear")
+
+        return ForecastResult(names, design.years, design.future_years, models, chosen)
+
+    def _fit_linear(self, design: _Design, values: np.ndarray) -> Dict[str, np.ndarray]:
+        observed = ~np.isnan(values)
+        weights = observed.astype(np.float64)
+        y = np.where(observed, values, 0.0)
+
+        # Równania normalne liczone sumami, więc braki danych w dowolnych
+        # seriach nie wymagają osobnego dopasowania dla każdej z nich.
+        n = weights.sum(axis=1)
+        s_t = weights @ design.t
+        s_tt = weights @ design.t2
+        s_y = y.sum(axis=1)
+        s_ty = y @ design.t
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            det = n * s_tt - s_t**2
+            slope = np.where(det > 0, (n * s_ty - s_t * s_y) / det, 0.0)
+            intercept = (s_y - slope * s_t) / n
+
+            fitted = intercept[:, None] + slope[:, None] * design.t
+            sse = (np.where(observed, values - fitted, 0.0) ** 2).sum(axis=1)
+            df = n - 2
+            sigma2 = np.where(df > 0, sse / df, np.nan)
+
+            future_t = design.future_t[None, :]
+            forecast = intercept[:, None] + slope[:, None] * future_t
+            leverage = (
+                s_tt[:, None] - 2 * future_t * s_t[:, None] + future_t**2 * n[:, None]
+            ) / det[:, None]
+            margin = t_quantile_95(df)[:, None] * np.sqrt(
+                sigma2[:, None] * (1 + leverage)
+            )
+            slope_se = np.sqrt(sigma2 * n / det)
+
+            # Błędy prognozy na kolejny rok z dopasowań do rosnącej historii;
+            # te same sumy skumulowane po latach dają wszystkie okna naraz.
+            prefix = [
+                np.cumsum(part, axis=1)[:, :-1]
+                for part in (weights, weights * design.t, weights * design.t2, y)
+            ]
+            prefix.append(np.cumsum(y * design.t, axis=1)[:, :-1])
+            p_n, p_t, p_tt, p_y, p_ty = prefix
+            p_det = p_n * p_tt - p_t**2
+            p_slope = (p_n * p_ty - p_t * p_y) / p_det
+            p_intercept = (p_y - p_slope * p_t) / p_n
+            predicted = p_intercept + p_slope * design.t[1:]
+            errors = np.full_like(values, np.nan)
+            errors[:, 1:] = np.where(
+                (p_n >= 2) & (p_det > 0), values[:, 1:] - predicted, np.nan
+            )
+
+        return {
+            "fitted": fitted,
+            "forecast": forecast,
+            "lower": forecast - margin,
+            "upper": forecast + margin,
+            "level": fitted[:, -1],
+            "slope": slope,
+            "slope_se": slope_se,
+            "slope_margin": t_quantile_95(df) * slope_se,
+            "errors": errors,
+        }
+
+    def _fit_holt(self, design: _Design, values: np.ndarray) -> Dict[str, np.ndarray]:
+        level = np.full(len(values), np.nan)
+        trend = np.zeros(len(values))
+        fitted = np.full_like(values, np.nan)
+        increments = np.full_like(values, np.nan)
+
+        # Pętla biegnie po latach, a nie po seriach - każdy krok to operacja
+        # na wszystkich seriach jednocześnie.
+        for column in range(values.shape[1]):
+            predicted = level + trend
+            fitted[:, column] = predicted
+            observed = values[:, column]
+            missing = np.isnan(observed)
+            first = np.isnan(level) & ~missing
+
+            new_level = np.where(
+                missing,
+                predicted,
+                np.where(
+                    first,
+                    observed,
+                    self.alpha * observed + (1 - self.alpha) * predicted,
+                ),
+            )
+            updated = ~(missing | first)
+            increments[:, column] = np.where(updated, new_level - level, np.nan)
+            trend = np.where(
+                updated,
+                self.beta * (new_level - level) + (1 - self.beta) * trend,
+                trend,
+            )
+            level = new_level
+
+        errors = values - fitted
+        valid = ~np.isnan(errors)
+        count = valid.sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sigma2 = np.where(valid, errors**2, 0.0).sum(axis=1) / count
+            sigma2 = np.where(count > 0, sigma2, np.nan)
+
+        # Wariancja prognozy Holta na k kroków:
+        # sigma^2 * (1 + sum_{j<k} alpha^2 * (1 + j * beta)^2)
+        steps = np.arange(1, self.horizon + 1)
+        growth = (self.alpha * (1 + steps[:-1] * self.beta)) ** 2
+        variance = 1 + np.concatenate(([0.0], np.cumsum(growth)))
+        margin = t_quantile_95(count)[:, None] * np.sqrt(sigma2[:, None] * variance)
+
+        # Trend Holta to średnia wykładnicza (waga beta) przyrostów poziomu,
+        # więc jego błąd standardowy to sd przyrostów * sqrt(beta / (2 - beta)).
+        valid = ~np.isnan(increments)
+        steps_seen = valid.sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = np.where(valid, increments, 0.0).sum(axis=1) / steps_seen
+            spread = np.where(valid, (increments - mean[:, None]) ** 2, 0.0).sum(1)
+            increment_sd = np.sqrt(spread / (steps_seen - 1))
+            increment_sd = np.where(steps_seen > 1, increment_sd, np.nan)
+        trend_se = increment_sd * np.sqrt(self.beta / (2 - self.beta))
+
+        forecast = level[:, None] + trend[:, None] * steps
+        return {
+            "fitted": fitted,
+            "forecast": forecast,
+            "lower": forecast - margin,
+            "upper": forecast + margin,
+            "level": level,
+            "slope": trend / design.step,
+            "slope_se": trend_se / design.step,
+            "slope_margin": t_quantile_95(steps_seen - 1) * trend_se / design.step,
+            "errors": errors,
+        }
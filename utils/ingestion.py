@@ -0,0 +1,203 @@
+import asyncio
+import csv
+import http.client
+import io
+import json
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from utils.data_loader import DataLoader
+
+
+class FetchError(Exception):
+    pass
+
+
+class ConnectionPool:
+    """Pula połączeń keep-alive, osobna dla każdego hosta"""
+
+    def __init__(self, max_per_host: int = 4, timeout: float = 10.0) -> None:
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+
+        self._idle: Dict[Tuple[str, str, int], List[http.client.HTTPConnection]] = (
+            defaultdict(list)
+        )
+        self._lock = threading.Lock()
+
+    def _new_connection(self, key: Tuple[str, str, int]) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=self.timeout)
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def request(self, url: str) -> Tuple[int, str, bytes]:
+        parts = urlsplit(url)
+        scheme = parts.scheme or "http"
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname or "localhost", port)
+
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        with self._lock:
+            idle = self._idle[key]
+            conn = idle.pop() if idle else self._new_connection(key)
+
+        try:
+            conn.request("GET", path, headers={"Connection": "keep-alive"})
+            response = conn.getresponse()
+            body = response.read()
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            raise
+
+        if response.will_close:
+            conn.close()
+        else:
+            with self._lock:
+                if len(self._idle[key]) < self.max_per_host:
+                    self._idle[key].append(conn)
+                else:
+                    conn.close()
+
+        return response.status, response.getheader("Content-Type", ""), body
+
+    def close(self) -> None:
+        with self._lock:
+            for connections in self._idle.values():
+                for conn in connections:
+                    conn.close()
+            self._idle.clear()
+
+
+def parse_feed(body: bytes, content_type: str, url: str) -> List[Dict[str, Any]]:
+    """Zamienia odpowiedź stacji (CSV lub JSON) na listę odczytów"""
+    text = body.decode("utf-8")
+
+    if "csv" in content_type or url.endswith(".csv"):
+        rows = list(csv.DictReader(io.StringIO(text)))
+    else:
+        payload = json.loads(text)
+        rows = payload.get("readings", []) if isinstance(payload, dict) else payload
+
+    readings = []
+    for row in rows:
+        reading = {
+            "station": row["station"],
+            "kind": row.get("kind") or "lakes",
+            "year": int(row["year"]),
+            "water_level": float(row["water_level"]),
+        }
+        if row.get("temperature") not in (None, ""):
+            reading["temperature"] = float(row["temperature"])
+        readings.append(reading)
+
+    return readings
+
+
+class GaugeIngestor:
+    """Pobiera dane ze stacji równolegle
+
+    Zapytania HTTP wykonuje blokujące http.client, więc asyncio przekazuje je
+    do własnej puli wątków. Pula ma `max_per_host` wątków na każdy host
+    (nie więcej niż `max_workers` łącznie), dzięki czemu to semafory hostów,
+    a nie domyślny executor asyncio, wyznaczają faktyczną równoległość.
+    """
+
+    def __init__(
+        self,
+        urls: List[str],
+        max_per_host: int = 4,
+        retries: int = 3,
+        backoff: float = 0.5,
+        timeout: float = 10.0,
+        max_workers: int = 128,
+    ) -> None:
+        self.urls = urls
+        self.max_per_host = max_per_host
+        self.max_workers = max_workers
+        self.retries = retries
+        self.backoff = backoff
+
+        self.pool = ConnectionPool(max_per_host, timeout)
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.max_per_host)
+        return self._host_limits[host]
+
+    async def fetch_station(self, url: str) -> List[Dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+
+        async with self._host_limit(url):
+            for attempt in range(self.retries + 1):
+                try:
+                    status, content_type, body = await loop.run_in_executor(
+                        self._executor, self.pool.request, url
+                    )
+                    if status == 200:
+                        return parse_feed(body, content_type, url)
+                    if status < 500 and status != 429:
+                        raise FetchError(f"{url}: HTTP {status}")
+                    error: Exception = FetchError(f"{url}: HTTP {status}")
+                except (OSError, http.client.HTTPException) as e:
+                    error = e
+
+                if attempt < self.retries:
+                    await asyncio.sleep(self.backoff * 2**attempt)
+
+            raise FetchError(f"{url}: {error}")
+
+    async def fetch_all(self) -> List[Dict[str, Any]]:
+        hosts = {urlsplit(url).netloc for url in self.urls}
+        workers = max(1, min(self.max_workers, self.max_per_host * len(hosts)))
+
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix="gauge")
+        try:
+            results = await asyncio.gather(
+                *(self.fetch_station(url) for url in self.urls),
+                return_exceptions=True,
+            )
+        finally:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+        readings = []
+        for url, result in zip(self.urls, results):
+            if isinstance(result, Exception):
+                print(f"Błąd pobierania danych ze stacji {url}: {result}")
+            else:
+                readings.extend(result)
+
+        return readings
+
+    def ingest(
+        self,
+        data_loader: Optional[DataLoader] = None,
+        filename: str = "hydro_data.json",
+    ) -> int:
+        """Pobiera wszystkie stacje i dopisuje nowe odczyty do pliku danych"""
+        data_loader = data_loader or DataLoader()
+
+        start = time.perf_counter()
+        try:
+            readings = asyncio.run(self.fetch_all())
+        finally:
+            self.pool.close()
+            self._host_limits.clear()
+
+        added = data_loader.append_readings(filename, readings)
+        print(
+            f"Pobrano {len(readings)} odczytów z {len(self.urls)} stacji "
+            f"w {time.perf_counter() - start:.2f} s, nowych: {added}"
+        )
+        return added
@@ -1,6 +1,6 @@
 import os
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -10,8 +10,25 @@ from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib.units import inch
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.platypus import (Image, Paragraph, SimpleDocTemplate, Spacer,
-                                Table, TableStyle)
+from reportlab.platypus import (
+    Image,
+    Paragraph,
+    SimpleDocTemplate,
+    Spacer,
+    Table,
+    TableStyle,
+)
+
+from utils.downsampling import Downsampler, point_budget
+from utils.forecasting import Forecaster, ForecastResult
+
+CHART_DPI = 300
+# Powyżej tej liczby punktów znaczniki zlewają się w linię i tylko spowalniają
+MARKER_LIMIT = 50
+
+# Roczna zmiana, poniżej której trend uznajemy za nieistotny
+WATER_TREND_THRESHOLD = 1.0
+TEMPERATURE_TREND_THRESHOLD = 0.2
 
 
 class ReportGenerator:
@@ -19,6 +36,8 @@ class ReportGenerator:
         self.reports_dir = reports_dir
         self.assets_dir = assets_dir
         self.font_path = os.path.join(assets_dir, "fonts")
+        self.downsampler = Downsampler()
+        self.forecaster = Forecaster()
 
         os.makedirs(reports_dir, exist_ok=True)
         os.makedirs(self.font_path, exist_ok=True)
@@ -94,54 +113,151 @@ class ReportGenerator:
 
         return custom_styles
 
-    def _analyze_trends(self, data: Dict[str, Any]) -> Dict[str, str]:
-        years = []
-        avg_levels = []
-        temperatures = []
-
-        for year_data in data["data_pomiarow"]:
-            years.append(year_data["year"])
-            avg_levels.append(year_data["average_water_level"])
-            temperatures.append(year_data["temperature"])
+    def _forecast(self, data: Dict[str, Any]) -> Optional[ForecastResult]:
+        if len(data["data_pomiarow"]) < 2:
+            return None
+        return self.forecaster.forecast_data(data)
 
+    def _analyze_trends(
+        self, data: Dict[str, Any], forecast: Optional[ForecastResult]
+    ) -> Dict[str, str]:
         trends = {}
 
-        if len(avg_levels) >= 2:
-            water_trend = np.polyfit(years, avg_levels, 1)[0]
-            if water_trend > 1:
+        if forecast is None:
+            return trends
+
+        target_year = int(forecast.future_years[-1])
+
+        water = forecast.series("average_water_level")
+        water_forecast = self._forecast_text(water, target_year, "cm")
+
+        match self._trend_direction(water, WATER_TREND_THRESHOLD):
+            case "up":
                 trends["water"] = (
-                    "Poziom wody wykazuje trend wzrostowy. Prognoza na przyszłość: stabilny lub rosnący poziom wód."
+                    f"Poziom wody wykazuje trend wzrostowy. Prognoza na przyszłość: stabilny lub rosnący poziom wód. {water_forecast}"
                 )
-            elif water_trend < -1:
+            case "down":
                 trends["water"] = (
-                    "Poziom wody wykazuje trend spadkowy. Prognoza na przyszłość: możliwe dalsze obniżanie się poziomu wód."
+                    f"Poziom wody wykazuje trend spadkowy. Prognoza na przyszłość: możliwe dalsze obniżanie się poziomu wód. {water_forecast}"
                 )
-            else:
+            case "stable":
                 trends["water"] = (
-                    "Poziom wody pozostaje relatywnie stabilny. Prognoza na przyszłość: utrzymanie obecnych poziomów."
+                    f"Poziom wody pozostaje relatywnie stabilny. Prognoza na przyszłość: utrzymanie obecnych poziomów. {water_forecast}"
                 )
+            case _:
+                trends["water"] = (
+                    f"Dane nie pozwalają jednoznacznie określić trendu poziomu wody - niepewność nachylenia jest zbyt duża. Potrzebne są dalsze pomiary. {water_forecast}"
+                )
+
+        temperature = forecast.series("temperature")
+        temp_forecast = self._forecast_text(temperature, target_year, "°C")
 
-        if len(temperatures) >= 2:
-            temp_trend = np.polyfit(years, temperatures, 1)[0]
-            if temp_trend > 0.2:
+        match self._trend_direction(temperature, TEMPERATURE_TREND_THRESHOLD):
+            case "up":
                 trends["temperature"] = (
-                    "Temperatura wykazuje trend wzrostowy. Może to wpływać na ekosystem wodny."
+                    f"Temperatura wykazuje trend wzrostowy. Może to wpływać na ekosystem wodny. {temp_forecast}"
+                )
+            case "down":
+                trends["temperature"] = (
+                    f"Temperatura wykazuje trend spadkowy. {temp_forecast}"
+                )
+            case "stable":
+                trends["temperature"] = (
+                    f"Temperatura pozostaje stabilna. {temp_forecast}"
+                )
+            case _:
+                trends["temperature"] = (
+                    f"Dane nie pozwalają jednoznacznie określić trendu temperatury - niepewność nachylenia jest zbyt duża. {temp_forecast}"
                 )
-            elif temp_trend < -0.2:
-                trends["temperature"] = "Temperatura wykazuje trend spadkowy."
-            else:
-                trends["temperature"] = "Temperatura pozostaje stabilna."
 
         return trends
 
+    @staticmethod
+    def _trend_direction(series: Dict[str, np.ndarray], threshold: float) -> str:
+        """Kierunek zmian z 95% przedziału ufności rocznego nachylenia trendu
+
+        Trend wzrostowy/spadkowy wymaga, by cały przedział leżał po jednej
+        stronie zera, a nachylenie przekraczało próg. Stabilność - by cały
+        przedział mieścił się w progu. W pozostałych przypadkach dane nie
+        rozstrzygają o kierunku.
+        """
+        slope, margin = series["slope"], series["slope_margin"]
+        if not np.isfinite([slope, margin]).all():
+            return "unknown"
+
+        lower, upper = slope - margin, slope + margin
+        if lower > 0 and slope > threshold:
+            return "up"
+        if upper < 0 and slope < -threshold:
+            return "down"
+        if -threshold <= lower and upper <= threshold:
+            return "stable"
+        return "unknown"
+
+    @staticmethod
+    def _forecast_text(series: Dict[str, np.ndarray], year: int, unit: str) -> str:
+        value = series["forecast"][-1]
+        lower, upper = series["lower"][-1], series["upper"][-1]
+
+        text = f"Prognozowana wartość na rok {year}: {value:.1f} {unit}"
+        if np.isfinite(lower) and np.isfinite(upper):
+            text += f" (95% przedział: {lower:.1f} – {upper:.1f} {unit})"
+        return text + "."
+
+    @staticmethod
+    def _line_style(points: int, marker: str, color: str) -> Dict[str, Any]:
+        style: Dict[str, Any] = {"linewidth": 2, "color": color}
+        if points <= MARKER_LIMIT:
+            style.update(marker=marker, markersize=8)
+        else:
+            style["linewidth"] = 1
+        return style
+
+    def _plot_forecast(
+        self,
+        ax,
+        data: Dict[str, Any],
+        forecast: Optional[ForecastResult],
+        name: str,
+        color: str,
+    ) -> None:
+        if forecast is None:
+            return
+
+        series = forecast.series(name)
+
+        last = max(data["data_pomiarow"], key=lambda year_data: year_data["year"])
+        x = np.concatenate(([last["year"]], forecast.future_years))
+        y = np.concatenate(([last[name]], series["forecast"]))
+        ax.plot(x, y, linestyle="--", linewidth=2, color=color, label="Prognoza")
+
+        if np.all(np.isfinite(series["lower"])):
+            ax.fill_between(
+                forecast.future_years,
+                series["lower"],
+                series["upper"],
+                color=color,
+                alpha=0.2,
+                label="95% przedział prognozy",
+            )
+        ax.legend(loc="best")
+
     def _create_chart(
-        self, data: Dict[str, Any], chart_type: str = "water_level"
+        self,
+        data: Dict[str, Any],
+        chart_type: str = "water_level",
+        forecast: Optional[ForecastResult] = None,
     ) -> str:
         """Tworzy wykres i zwraca ścieżkę do pliku"""
         plt.style.use("default")
         fig, ax = plt.subplots(figsize=(10, 6))
 
         years = [year_data["year"] for year_data in data["data_pomiarow"]]
+        budget = point_budget(ax.get_position().width * fig.get_figwidth(), CHART_DPI)
+        # Skrót danych liczymy tylko dla serii, które faktycznie są przerzedzane
+        dataset_key = (
+            self.forecaster.dataset_hash(data) if len(years) > budget else None
+        )
 
         filename = "chart.png"
 
@@ -149,9 +265,11 @@ class ReportGenerator:
             values = [
                 year_data["average_water_level"] for year_data in data["data_pomiarow"]
             ]
-            ax.plot(
-                years, values, marker="o", linewidth=2, markersize=8, color="#2E86AB"
+            x, y = self.downsampler.downsample(
+                years, values, budget, dataset_key and (dataset_key, chart_type)
             )
+            ax.plot(x, y, **self._line_style(len(x), "o", "#2E86AB"))
+            self._plot_forecast(ax, data, forecast, "average_water_level", "#2E86AB")
             ax.set_ylabel("Średni poziom wody (cm)", fontsize=12)
             ax.set_title(
                 "Średni poziom wody w jeziorach mazurskich",
@@ -162,9 +280,11 @@ class ReportGenerator:
 
         elif chart_type == "temperature":
             values = [year_data["temperature"] for year_data in data["data_pomiarow"]]
-            ax.plot(
-                years, values, marker="s", linewidth=2, markersize=8, color="#A23B72"
+            x, y = self.downsampler.downsample(
+                years, values, budget, dataset_key and (dataset_key, chart_type)
             )
+            ax.plot(x, y, **self._line_style(len(x), "s", "#A23B72"))
+            self._plot_forecast(ax, data, forecast, "temperature", "#A23B72")
             ax.set_ylabel("Temperatura (°C)", fontsize=12)
             ax.set_title(
                 "Średnia temperatura w rejonie jezior mazurskich",
@@ -175,12 +295,14 @@ class ReportGenerator:
 
         ax.set_xlabel("Rok", fontsize=12)
         ax.grid(True, alpha=0.3)
-        ax.set_xticks(years)
+        future_years = [] if forecast is None else forecast.future_years.tolist()
+        if len(years) + len(future_years) <= MARKER_LIMIT:
+            ax.set_xticks(years + [int(year) for year in future_years])
 
         plt.tight_layout()
 
         chart_path = os.path.join(self.reports_dir, filename)
-        plt.savefig(chart_path, dpi=300, bbox_inches="tight")
+        plt.savefig(chart_path, dpi=CHART_DPI, bbox_inches="tight")
         plt.close()
 
         return chart_path
@@ -209,7 +331,9 @@ class ReportGenerator:
             story.append(info)
             story.append(Spacer(1, 20))
 
-            chart_path = self._create_chart(data, "water_level")
+            forecast = self._forecast(data)
+
+            chart_path = self._create_chart(data, "water_level", forecast)
             if os.path.exists(chart_path):
                 img = Image(chart_path, width=6 * inch, height=3.6 * inch)
                 story.append(img)
@@ -225,7 +349,11 @@ class ReportGenerator:
                     [
                         str(year_data["year"]),
                         f"{year_data['average_water_level']:.2f}",
-                        f"{year_data['temperature']:.1f}",
+                        (
+                            f"{year_data['temperature']:.1f}"
+                            if year_data["temperature"] is not None
+                            else "brak danych"
+                        ),
                     ]
                 )
 
@@ -248,7 +376,7 @@ class ReportGenerator:
             story.append(table)
             story.append(Spacer(1, 20))
 
-            trends = self._analyze_trends(data)
+            trends = self._analyze_trends(data, forecast)
             story.append(
                 Paragraph("Analiza trendów i prognoza", styles["CustomHeading"])
             )
@@ -296,13 +424,15 @@ class ReportGenerator:
             story.append(title)
             story.append(Spacer(1, 20))
 
-            chart_path = self._create_chart(data, "temperature")
+            forecast = self._forecast(data)
+
+            chart_path = self._create_chart(data, "temperature", forecast)
             if os.path.exists(chart_path):
                 img = Image(chart_path, width=6 * inch, height=3.6 * inch)
                 story.append(img)
                 story.append(Spacer(1, 20))
 
-            trends = self._analyze_trends(data)
+            trends = self._analyze_trends(data, forecast)
             if "temperature" in trends:
                 analysis = Paragraph(
                     f"Analiza: {trends['temperature']}", styles["CustomBody"]
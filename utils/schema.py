@@ -0,0 +1,293 @@
+import operator
+from collections import defaultdict
+from itertools import chain, repeat
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+
+HYDRO_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "required": ["nazwa_projektu", "lokalizacja", "data_pomiarow"],
+    "properties": {
+        "nazwa_projektu": {"type": "string"},
+        "lokalizacja": {"type": "string"},
+        "data_pomiarow": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": [
+                    "year",
+                    "water_bodies",
+                    "average_water_level",
+                    "temperature",
+                ],
+                "properties": {
+                    "year": {"type": "integer", "minimum": 1800, "maximum": 2200},
+                    "water_bodies": {
+                        "type": "object",
+                        "additionalProperties": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "required": ["name", "water_level"],
+                                "properties": {
+                                    "name": {"type": "string"},
+                                    "water_level": {
+                                        "type": ["number", "null"],
+                                        "minimum": 0,
+                                    },
+                                },
+                            },
+                        },
+                    },
+                    "average_water_level": {"type": "number", "minimum": 0},
+                    "temperature": {
+                        "type": ["number", "null"],
+                        "minimum": -50,
+                        "maximum": 50,
+                    },
+                },
+            },
+        },
+    },
+}
+
+# Typy spoza słownika (np. bool) dostają kod 0 i nie pasują do żadnego typu
+_TYPE_CODES = defaultdict(
+    int, {str: 1, int: 2, float: 3, dict: 4, list: 5, type(None): 6}
+)
+_SCHEMA_TYPES = {
+    "string": [1],
+    "integer": [2],
+    "number": [2, 3],
+    "object": [4],
+    "array": [5],
+    "null": [6],
+}
+
+
+class Violation(NamedTuple):
+    path: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.path}: {self.message}"
+
+
+class _Batch:
+    """Wartości z tego samego miejsca schematu, zebrane ze wszystkich rekordów
+
+    Ścieżka JSON nie jest budowana dla każdej wartości z góry - każda partia
+    pamięta tylko indeks rodzica i etykietę, a ścieżka powstaje dopiero
+    dla wartości, które nie przeszły walidacji.
+    """
+
+    def __init__(
+        self,
+        values: List[Any],
+        parent: Optional["_Batch"] = None,
+        parent_index: Optional[np.ndarray] = None,
+        labels: Union[str, np.ndarray, None] = None,
+    ) -> None:
+        self.values = values
+        self.parent = parent
+        self.parent_index = parent_index
+        self.labels = labels
+
+    def path(self, i: int) -> str:
+        parts = []
+        batch = self
+        while batch.parent is not None:
+            label = batch.labels if isinstance(batch.labels, str) else batch.labels[i]
+            parts.append(f".{label}" if isinstance(label, str) else f"[{label}]")
+            i = int(batch.parent_index[i])
+            batch = batch.parent
+        return "$" + "".join(reversed(parts))
+
+    def take(self, index: np.ndarray) -> "_Batch":
+        return _Batch(
+            [self.values[i] for i in index.tolist()],
+            self.parent,
+            None if self.parent_index is None else self.parent_index[index],
+            (
+                self.labels
+                if self.labels is None or isinstance(self.labels, str)
+                else self.labels[index]
+            ),
+        )
+
+
+_Checker = Callable[[_Batch, List[Violation], Optional[np.random.Generator]], None]
+
+
+def _report(
+    batch: _Batch, bad: np.ndarray, message: str, errors: List[Violation]
+) -> None:
+    for i in np.flatnonzero(bad):
+        errors.append(Violation(batch.path(int(i)), message))
+
+
+def _compile(schema: Dict[str, Any], sample: Optional[int]) -> _Checker:
+    expected = schema.get("type")
+    types = [expected] if isinstance(expected, str) else expected or []
+    allowed = (
+        np.array([code for name in types for code in _SCHEMA_TYPES[name]])
+        if types
+        else None
+    )
+    minimum = schema.get("minimum")
+    maximum = schema.get("maximum")
+
+    properties = {
+        key: _compile(sub, sample) for key, sub in schema.get("properties", {}).items()
+    }
+    additional = (
+        _compile(schema["additionalProperties"], sample)
+        if "additionalProperties" in schema
+        else None
+    )
+    required: Sequence[str] = schema.get("required", [])
+    items = _compile(schema["items"], sample) if "items" in schema else None
+
+    def check(
+        batch: _Batch, errors: List[Violation], rng: Optional[np.random.Generator]
+    ) -> None:
+        n = len(batch.values)
+        if n == 0:
+            return
+
+        codes = np.fromiter(
+            map(_TYPE_CODES.__getitem__, map(type, batch.values)), np.int8, n
+        )
+
+        if allowed is None:
+            ok = np.ones(n, dtype=bool)
+        else:
+            ok = np.isin(codes, allowed)
+            _report(batch, ~ok, f"oczekiwano typu '{' lub '.join(types)}'", errors)
+
+        if minimum is not None or maximum is not None:
+            numeric = ok & (codes >= 2) & (codes <= 3)
+            if numeric.all():
+                values = np.fromiter(batch.values, np.float64, n)
+            else:
+                values = np.fromiter(
+                    (v if good else 0.0 for v, good in zip(batch.values, numeric)),
+                    np.float64,
+                    n,
+                )
+            _report(
+                batch, numeric & ~np.isfinite(values), "wartość nieskończona", errors
+            )
+            if minimum is not None:
+                _report(
+                    batch,
+                    numeric & (values < minimum),
+                    f"wartość mniejsza niż {minimum}",
+                    errors,
+                )
+            if maximum is not None:
+                _report(
+                    batch,
+                    numeric & (values > maximum),
+                    f"wartość większa niż {maximum}",
+                    errors,
+                )
+
+        if "object" in types:
+            objects = np.flatnonzero(ok & (codes == _TYPE_CODES[dict]))
+            present_batch = batch if len(objects) == n else batch.take(objects)
+            dicts = present_batch.values
+
+            for key in required:
+                present = np.fromiter(
+                    map(operator.contains, dicts, repeat(key)), bool, len(dicts)
+                )
+                _report(
+                    present_batch,
+                    ~present,
+                    f"brak wymaganego klucza '{key}'",
+                    errors,
+                )
+
+            for key, checker in properties.items():
+                present = np.fromiter(
+                    map(operator.contains, dicts, repeat(key)), bool, len(dicts)
+                )
+                values = [d[key] for d, has in zip(dicts, present) if has]
+                checker(_Batch(values, batch, objects[present], key), errors, rng)
+
+            if additional is not None:
+                extra = [
+                    (i, key, value)
+                    for i, d in zip(objects, dicts)
+                    for key, value in d.items()
+                    if key not in properties
+                ]
+                child = _Batch(
+                    [value for _, _, value in extra],
+                    batch,
+                    np.array([i for i, _, _ in extra], dtype=np.intp),
+                    np.array([key for _, key, _ in extra], dtype=object),
+                )
+                additional(child, errors, rng)
+
+        if "array" in types and items is not None:
+            arrays = np.flatnonzero(ok & (codes == _TYPE_CODES[list]))
+            lists = [batch.values[i] for i in arrays.tolist()]
+            lengths = np.fromiter(map(len, lists), np.intp, len(lists))
+            ends = np.cumsum(lengths)
+            total = int(ends[-1]) if len(ends) else 0
+
+            if rng is not None and sample is not None and total > sample:
+                # Najpierw losujemy pozycje, a dopiero potem sięgamy po same
+                # wylosowane elementy - reszta tablic nie jest przepisywana.
+                chosen = np.sort(rng.choice(total, sample, replace=False))
+                owners = np.searchsorted(ends, chosen, side="right")
+                positions = chosen - (ends - lengths)[owners]
+                child = _Batch(
+                    [
+                        lists[owner][position]
+                        for owner, position in zip(owners.tolist(), positions.tolist())
+                    ],
+                    batch,
+                    arrays[owners],
+                    positions,
+                )
+            else:
+                offsets = np.repeat(ends - lengths, lengths)
+                child = _Batch(
+                    list(chain.from_iterable(lists)),
+                    batch,
+                    np.repeat(arrays, lengths),
+                    np.arange(total) - offsets,
+                )
+
+            items(child, errors, rng)
+
+    return check
+
+
+class SchemaValidator:
+    """Schemat kompilowany raz do funkcji sprawdzających całe kolumny naraz"""
+
+    def __init__(self, schema: Dict[str, Any], sample_size: int = 10_000) -> None:
+        self.schema = schema
+        self.sample_size = sample_size
+        self._check = _compile(schema, sample_size)
+
+    def validate(
+        self, data: Any, sample: bool = False, seed: Optional[int] = None
+    ) -> List[Violation]:
+        """Zwraca wszystkie naruszenia schematu
+
+        W trybie próbkowania każda tablica jest sprawdzana tylko na losowej
+        próbce `sample_size` elementów, co pozwala szybko ocenić duże pliki.
+        """
+        errors: List[Violation] = []
+        rng = np.random.default_rng(seed) if sample else None
+        self._check(_Batch([data]), errors, rng)
+        return errors
+
+
+HYDRO_VALIDATOR = SchemaValidator(HYDRO_SCHEMA)
@@ -0,0 +1,42 @@
+from typing import Dict
+
+import pygame
+
+
+class Screen:
+    """Bazowy ekran z cyklem życia: enter -> suspend -> enter ... -> exit
+
+    Ciężkie powierzchnie (mapy) ładowane są dopiero przy wejściu na ekran
+    i zwalniane, gdy ekran traci fokus. Pliki PNG na dysku są już
+    skompresowane, więc ponowne wczytanie jest tańsze niż trzymanie
+    własnej kopii w pamięci.
+    """
+
+    surface_paths: Dict[str, str] = {}
+
+    def __init__(self) -> None:
+        self.surfaces: Dict[str, pygame.Surface] = {}
+
+    def enter(self) -> None:
+        for name, path in self.surface_paths.items():
+            if name not in self.surfaces:
+                self.surfaces[name] = pygame.image.load(path)
+
+    def suspend(self) -> None:
+        self.surfaces.clear()
+
+    def exit(self) -> None:
+        """Wywoływane przy zamykaniu aplikacji"""
+        self.suspend()
+
+    def memory_usage(self) -> int:
+        return sum(
+            surface.get_pitch() * surface.get_height()
+            for surface in self.surfaces.values()
+        )
+
+    def handle_events(self, ev: pygame.event.Event) -> None:
+        pass
+
+    def render(self, w: pygame.Surface) -> None:
+        pass
@@ -1,4 +1,7 @@
 from random import randint
+from typing import Callable, Dict, Optional
+
+from utils.screen import Screen
 
 
 class State:
@@ -21,3 +24,51 @@ class State:
     @classmethod
     def toggle_run_state(cls, run: bool) -> None:
         cls.running = run
+
+
+class ScreenManager:
+    """Tworzy ekrany przy pierwszej wizycie i zwalnia zasoby nieaktywnych"""
+
+    def __init__(self, factories: Dict[str, Callable[[], Screen]]) -> None:
+        self.factories = factories
+
+        self.state = State()
+        self.screens: Dict[str, Screen] = {}
+        self.active: Optional[str] = None
+
+    @property
+    def current(self) -> Screen:
+        if self.active is None:
+            self.update()
+        return self.screens[self.active]
+
+    def update(self) -> None:
+        if self.state.state == self.active:
+            return
+
+        if self.active is not None:
+            self.screens[self.active].suspend()
+
+        self.active = self.state.state
+        if self.active not in self.screens:
+            self.screens[self.active] = self.factories[self.active]()
+
+        self.screens[self.active].enter()
+        self.report_memory()
+
+    def memory_usage(self) -> Dict[str, int]:
+        return {name: screen.memory_usage() for name, screen in self.screens.items()}
+
+    def total_memory(self) -> int:
+        return sum(self.memory_usage().values())
+
+    def report_memory(self) -> None:
+        for name, usage in self.memory_usage().items():
+            print(f"Ekran {name}: powierzchnie {usage / 1024:.0f} KiB")
+        print(f"Razem: {self.total_memory() / 1024:.0f} KiB")
+
+    def close(self) -> None:
+        for screen in self.screens.values():
+            screen.exit()
+        self.screens.clear()
+        self.active = None